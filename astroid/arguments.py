@@ -29,6 +29,15 @@ class CallSite:
         An instance of :class:`astroid.context.Context`.
     """
 
+    __slots__ = (
+        "argument_context_map",
+        "duplicated_keywords",
+        "_unpacked_args",
+        "_unpacked_kwargs",
+        "positional_arguments",
+        "keyword_arguments",
+    )
+
     def __init__(
         self,
         callcontext: CallContext,
@@ -175,7 +175,11 @@ def _infer_stmts(
                 if not constraint_stmt.parent_of(stmt):
                     stmt_constraints.update(potential_constraints)
             for inf in stmt.infer(context=context):
-                if all(constraint.satisfied_by(inf) for constraint in stmt_constraints):
+                # Most statements are unconstrained: avoid building the
+                # all() generator for every inferred value in that case.
+                if not stmt_constraints or all(
+                    constraint.satisfied_by(inf) for constraint in stmt_constraints
+                ):
                     yield inf
                     inferred = True
                 else:
@@ -296,11 +300,12 @@ class BaseInstance(Proxy):
                     yield from attr.infer_call_result(self, context)
                 else:
                     yield BoundMethod(attr, self)
-            elif hasattr(attr, "name") and attr.name == "<lambda>":
-                if attr.args.arguments and attr.args.arguments[0].name == "self":
-                    yield BoundMethod(attr, self)
-                    continue
-                yield attr
+            elif (
+                getattr(attr, "name", None) == "<lambda>"
+                and attr.args.arguments
+                and attr.args.arguments[0].name == "self"
+            ):
+                yield BoundMethod(attr, self)
             else:
                 yield attr
 
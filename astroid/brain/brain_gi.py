@@ -11,7 +11,7 @@ Helps with understanding everything imported from 'gi.repository'
 
 import inspect
 import itertools
-import re
+import keyword
 import sys
 import warnings
 
@@ -22,8 +22,6 @@ from astroid.manager import AstroidManager
 
 _inspected_modules = {}
 
-_identifier_re = r"^[A-Za-z_]\w*$"
-
 _special_methods = frozenset(
     {
         "__lt__",
@@ -68,7 +66,7 @@ def _gi_build_stub(parent):  # noqa: C901
             continue
 
         # Check if this is a valid name in python
-        if not re.match(_identifier_re, name):
+        if not name.isidentifier() or keyword.iskeyword(name):
             continue
 
         try:
@@ -24,6 +24,8 @@ _NameNodes = Union[nodes.AssignAttr, nodes.Attribute, nodes.AssignName, nodes.Na
 class Constraint(ABC):
     """Represents a single constraint on a variable."""
 
+    __slots__ = ("node", "negate")
+
     def __init__(self, node: nodes.NodeNG, negate: bool) -> None:
         self.node = node
         """The node that this constraint applies to."""
@@ -49,6 +51,8 @@ class Constraint(ABC):
 class NoneConstraint(Constraint):
     """Represents an "is None" or "is not None" constraint."""
 
+    __slots__ = ()
+
     CONST_NONE: nodes.Const = nodes.Const(None)
 
     @classmethod
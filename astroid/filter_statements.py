@@ -99,7 +99,6 @@ def _filter_stmts(
     # take care node may be missing lineno information (this is the case for
     # nodes inserted for living objects)
     if myframe is frame and mystmt and mystmt.fromlineno is not None:
-        assert mystmt.fromlineno is not None, mystmt
         mylineno = mystmt.fromlineno + offset
     else:
         # disabling lineno filtering
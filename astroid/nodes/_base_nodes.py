@@ -14,7 +14,7 @@ import sys
 from collections.abc import Iterator
 from typing import TYPE_CHECKING, ClassVar
 
-from astroid.exceptions import AttributeInferenceError
+from astroid.exceptions import AstroidError, AttributeInferenceError
 from astroid.nodes.node_ng import NodeNG
 
 if TYPE_CHECKING:
@@ -35,18 +35,54 @@ class Statement(NodeNG):
     is_statement = True
     """Whether this node indicates a statement."""
 
+    _sibling_position: tuple[str, list[NodeNG], int] | None = None
+    """The parent field and sequence containing this statement and its index."""
+
+    def _sibling_statements(self) -> tuple[list[NodeNG], int]:
+        """Get the sequence containing this statement and its index in it.
+
+        The position of every sibling is recorded the first time the
+        sequence is scanned. Since transforms can modify the tree, a
+        recorded position is only reused while it still matches the parent.
+        """
+        parent = self.parent
+        if self._sibling_position is not None:
+            field, stmts, index = self._sibling_position
+            if (
+                getattr(parent, field) is stmts
+                and index < len(stmts)
+                and stmts[index] is self
+            ):
+                return stmts, index
+
+        for field in parent._astroid_fields:
+            node_or_sequence = getattr(parent, field)
+            if node_or_sequence is self:
+                return [self], 0
+            if not isinstance(node_or_sequence, (tuple, list)):
+                continue
+            position = None
+            for index, stmt in enumerate(node_or_sequence):
+                if isinstance(stmt, Statement):
+                    stmt._sibling_position = (field, node_or_sequence, index)
+                if stmt is self:
+                    position = index
+            if position is not None:
+                return node_or_sequence, position
+
+        msg = "Could not find %s in %s's children"
+        raise AstroidError(msg % (repr(self), repr(parent)))
+
     def next_sibling(self):
         """The next sibling statement node.
 
         :returns: The next sibling statement node.
         :rtype: NodeNG or None
         """
-        stmts = self.parent.child_sequence(self)
-        index = stmts.index(self)
-        try:
+        stmts, index = self._sibling_statements()
+        if index + 1 < len(stmts):
             return stmts[index + 1]
-        except IndexError:
-            return None
+        return None
 
     def previous_sibling(self):
         """The previous sibling statement.
@@ -54,8 +90,7 @@ class Statement(NodeNG):
         :returns: The previous sibling statement node.
         :rtype: NodeNG or None
         """
-        stmts = self.parent.child_sequence(self)
-        index = stmts.index(self)
+        stmts, index = self._sibling_statements()
         if index >= 1:
             return stmts[index - 1]
         return None
@@ -64,6 +99,8 @@ class Statement(NodeNG):
 class NoChildrenNode(NodeNG):
     """Base nodes for nodes with no children, e.g. Pass."""
 
+    _is_leaf = True
+
     def get_children(self) -> Iterator[NodeNG]:
         yield from ()
 
@@ -149,16 +186,31 @@ class ImportNode(FilterStmtsBaseNode, NoChildrenNode, Statement):
             use_cache=use_cache,
         )
 
-    def real_name(self, asname: str) -> str:
-        """Get name from 'as' name."""
-        for name, _asname in self.names:
+    @cached_property
+    def _real_names(self) -> tuple[dict[str, str], bool]:
+        """Map every 'as' name to the name it was imported as.
+
+        The second item tells whether a wildcard is imported, in which case
+        names missing from the mapping are their own real name.
+        """
+        real_names: dict[str, str] = {}
+        for name, asname in self.names:
             if name == "*":
-                return asname
-            if not _asname:
+                return real_names, True
+            if not asname:
                 name = name.split(".", 1)[0]
-                _asname = name
-            if asname == _asname:
-                return name
+                asname = name
+            real_names.setdefault(asname, name)
+        return real_names, False
+
+    def real_name(self, asname: str) -> str:
+        """Get name from 'as' name."""
+        real_names, wildcard = self._real_names
+        name = real_names.get(asname)
+        if name is not None:
+            return name
+        if wildcard:
+            return asname
         raise AttributeInferenceError(
             "Could not find original name for {attribute} in {target!r}",
             target=self,
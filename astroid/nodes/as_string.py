@@ -53,9 +53,7 @@ class AsStringVisitor:
 
     def _stmt_list(self, stmts: list, indent: bool = True) -> str:
         """return a list of nodes to string"""
-        stmts_str: str = "\n".join(
-            nstr for nstr in [n.accept(self) for n in stmts] if nstr
-        )
+        stmts_str: str = "\n".join(filter(None, (n.accept(self) for n in stmts)))
         if not indent:
             return stmts_str
 
@@ -148,8 +146,9 @@ class AsStringVisitor:
 
     def visit_boolop(self, node) -> str:
         """return an astroid.BoolOp node as string"""
-        values = [f"{self._precedence_parens(node, n)}" for n in node.values]
-        return (f" {node.op} ").join(values)
+        return f" {node.op} ".join(
+            self._precedence_parens(node, n) for n in node.values
+        )
 
     def visit_break(self, node) -> str:
         """return an astroid.Break node as string"""
@@ -218,11 +217,11 @@ class AsStringVisitor:
 
     def visit_decorators(self, node) -> str:
         """return an astroid.Decorators node as string"""
-        return "@%s\n" % "\n@".join(item.accept(self) for item in node.nodes)
+        return "@" + "\n@".join(item.accept(self) for item in node.nodes) + "\n"
 
     def visit_dict(self, node) -> str:
         """return an astroid.Dict node as string"""
-        return "{%s}" % ", ".join(self._visit_dict(node))
+        return f"{{{', '.join(self._visit_dict(node))}}}"
 
     def _visit_dict(self, node) -> Iterator[str]:
         for key, value in node.items:
@@ -315,7 +314,7 @@ class AsStringVisitor:
             # The format spec is itself a JoinedString, i.e. an f-string
             # We strip the f and quotes of the ends
             result += ":" + node.format_spec.accept(self)[2:-1]
-        return "{%s}" % result
+        return f"{{{result}}}"
 
     def handle_functiondef(self, node, keyword) -> str:
         """return a (possibly async) function definition node as string"""
@@ -325,15 +324,9 @@ class AsStringVisitor:
         if node.returns:
             return_annotation = " -> " + node.returns.as_string()
             trailer = return_annotation + ":"
-        def_format = "\n%s%s %s(%s)%s%s\n%s"
-        return def_format % (
-            decorate,
-            keyword,
-            node.name,
-            node.args.accept(self),
-            trailer,
-            docs,
-            self._stmt_list(node.body),
+        return (
+            f"\n{decorate}{keyword} {node.name}({node.args.accept(self)}){trailer}"
+            f"{docs}\n{self._stmt_list(node.body)}"
         )
 
     def visit_functiondef(self, node) -> str:
@@ -451,7 +444,7 @@ class AsStringVisitor:
 
     def visit_set(self, node) -> str:
         """return an astroid.Set node as string"""
-        return "{%s}" % ", ".join(child.accept(self) for child in node.elts)
+        return f"{{{', '.join(child.accept(self) for child in node.elts)}}}"
 
     def visit_setcomp(self, node) -> str:
         """return an astroid.SetComp node as string"""
@@ -643,13 +636,9 @@ class AsStringVisitor:
 
 def _import_string(names) -> str:
     """return a list of (name, asname) formatted as a string"""
-    _names = []
-    for name, asname in names:
-        if asname is not None:
-            _names.append(f"{name} as {asname}")
-        else:
-            _names.append(name)
-    return ", ".join(_names)
+    return ", ".join(
+        f"{name} as {asname}" if asname is not None else name for name, asname in names
+    )
 
 
 # This sets the default indent to 4 spaces.
@@ -2468,11 +2468,13 @@ class If(_base_nodes.MultiLineWithElseBlockNode, _base_nodes.Statement):
         :returns: The range of line numbers that this node belongs to,
             starting at the given line number.
         """
-        if lineno == self.body[0].fromlineno:
+        body_start = self.body[0].fromlineno
+        if lineno == body_start:
             return lineno, lineno
-        if lineno <= self.body[-1].tolineno:
-            return lineno, self.body[-1].tolineno
-        return self._elsed_block_range(lineno, self.orelse, self.body[0].fromlineno - 1)
+        body_end = self.body[-1].tolineno
+        if lineno <= body_end:
+            return lineno, body_end
+        return self._elsed_block_range(lineno, self.orelse, body_start - 1)
 
     def get_children(self):
         yield self.test
@@ -3146,10 +3148,13 @@ class TryExcept(_base_nodes.MultiLineWithElseBlockNode, _base_nodes.Statement):
         for exhandler in self.handlers:
             if exhandler.type and lineno == exhandler.type.fromlineno:
                 return lineno, lineno
-            if exhandler.body[0].fromlineno <= lineno <= exhandler.body[-1].tolineno:
-                return lineno, exhandler.body[-1].tolineno
+            body_start = exhandler.body[0].fromlineno
+            if body_start <= lineno:
+                body_end = exhandler.body[-1].tolineno
+                if lineno <= body_end:
+                    return lineno, body_end
             if last is None:
-                last = exhandler.body[0].fromlineno - 1
+                last = body_start - 1
         return self._elsed_block_range(lineno, self.orelse, last)
 
     def get_children(self):
@@ -3327,24 +3332,34 @@ class TryStar(_base_nodes.MultiLineWithElseBlockNode, _base_nodes.Statement):
         """Get a range from a given line number to where this node ends."""
         if lineno == self.fromlineno:
             return lineno, lineno
-        if self.body and self.body[0].fromlineno <= lineno <= self.body[-1].tolineno:
-            # Inside try body - return from lineno till end of try body
-            return lineno, self.body[-1].tolineno
+        if self.body and self.body[0].fromlineno <= lineno:
+            body_end = self.body[-1].tolineno
+            if lineno <= body_end:
+                # Inside try body - return from lineno till end of try body
+                return lineno, body_end
         for exhandler in self.handlers:
             if exhandler.type and lineno == exhandler.type.fromlineno:
                 return lineno, lineno
-            if exhandler.body[0].fromlineno <= lineno <= exhandler.body[-1].tolineno:
-                return lineno, exhandler.body[-1].tolineno
+            if exhandler.body[0].fromlineno <= lineno:
+                body_end = exhandler.body[-1].tolineno
+                if lineno <= body_end:
+                    return lineno, body_end
         if self.orelse:
-            if self.orelse[0].fromlineno - 1 == lineno:
+            orelse_start = self.orelse[0].fromlineno
+            if orelse_start - 1 == lineno:
                 return lineno, lineno
-            if self.orelse[0].fromlineno <= lineno <= self.orelse[-1].tolineno:
-                return lineno, self.orelse[-1].tolineno
+            if orelse_start <= lineno:
+                orelse_end = self.orelse[-1].tolineno
+                if lineno <= orelse_end:
+                    return lineno, orelse_end
         if self.finalbody:
-            if self.finalbody[0].fromlineno - 1 == lineno:
+            finalbody_start = self.finalbody[0].fromlineno
+            if finalbody_start - 1 == lineno:
                 return lineno, lineno
-            if self.finalbody[0].fromlineno <= lineno <= self.finalbody[-1].tolineno:
-                return lineno, self.finalbody[-1].tolineno
+            if finalbody_start <= lineno:
+                finalbody_end = self.finalbody[-1].tolineno
+                if lineno <= finalbody_end:
+                    return lineno, finalbody_end
         return lineno, self.tolineno
 
     def get_children(self):
@@ -4566,13 +4581,13 @@ def const_factory(value: Any) -> ConstFactoryResult:
     # This only handles instances of the CONST types. Any
     # subclasses get inferred as EmptyNode.
     # TODO: See if we should revisit these with the normal builder.
-    if value.__class__ not in CONST_CLS:
+    initializer_cls = CONST_CLS.get(value.__class__)
+    if initializer_cls is None:
         node = EmptyNode()
         node.object = value
         return node
 
     instance: List | Set | Tuple | Dict
-    initializer_cls = CONST_CLS[value.__class__]
     if issubclass(initializer_cls, (List, Set, Tuple)):
         instance = initializer_cls()
         instance.postinit(_create_basic_elements(value, instance))
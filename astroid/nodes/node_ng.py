@@ -31,7 +31,7 @@ from astroid.exceptions import (
     UseInferenceDefault,
 )
 from astroid.manager import AstroidManager
-from astroid.nodes.as_string import AsStringVisitor
+from astroid.nodes.as_string import to_code
 from astroid.nodes.const import OP_PRECEDENCE
 from astroid.nodes.utils import Position
 from astroid.typing import InferenceErrorInfo, InferenceResult, InferFn
@@ -76,6 +76,8 @@ class NodeNG:
     is_function: ClassVar[bool] = False  # True for FunctionDef nodes
     """Whether this node indicates a function."""
     is_lambda: ClassVar[bool] = False
+    _is_leaf: ClassVar[bool] = False
+    """Whether this node can never have child nodes."""
 
     # Attributes below are set by the builder module or by raw factories
     _astroid_fields: ClassVar[tuple[str, ...]] = ()
@@ -89,6 +91,12 @@ class NodeNG:
     """Attributes that contain AST-dependent fields."""
     # instance specific inference function infer(node, context)
     _explicit_inference: InferFn | None = None
+    _visit_name: ClassVar[str] = "visit_nodeng"
+    """Name of the visitor method called by :meth:`accept`."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._visit_name = "visit_" + cls.__name__.lower()
 
     def __init__(
         self,
@@ -248,7 +256,7 @@ class NodeNG:
 
     def accept(self, visitor):
         """Visit this node using the given visitor."""
-        func = getattr(visitor, "visit_" + self.__class__.__name__.lower())
+        func = getattr(visitor, self._visit_name)
         return func(self)
 
     def get_children(self) -> Iterator[NodeNG]:
@@ -289,7 +297,10 @@ class NodeNG:
 
         :returns: Whether this node is the parent of the given node.
         """
-        return any(self is parent for parent in node.node_ancestors())
+        for parent in node.node_ancestors():
+            if parent is self:
+                return True
+        return False
 
     @overload
     def statement(self, *, future: None = ...) -> nodes.Statement | nodes.Module:
@@ -324,7 +335,15 @@ class NodeNG:
                 stacklevel=2,
             )
             raise AttributeError(f"{self} object has no attribute 'parent'")
-        return self.parent.statement(future=future)
+        # Walk up iteratively rather than recursing once per ancestor.
+        # The topmost non-statement node handles the lookup itself, as it
+        # might be a Module overriding this method.
+        node = self.parent
+        while not node.is_statement and node.parent:
+            node = node.parent
+        if node.is_statement:
+            return cast("nodes.Statement", node)
+        return node.statement(future=future)
 
     def frame(
         self, *, future: Literal[None, True] = None
@@ -367,9 +386,12 @@ class NodeNG:
 
         :returns: The root node.
         """
-        if self.parent:
-            return self.parent.root()
-        return self  # type: ignore[return-value] # Only 'Module' does not have a parent node.
+        node = self
+        parent = node.parent
+        while parent is not None:
+            node = parent
+            parent = node.parent
+        return node  # type: ignore[return-value] # Only 'Module' does not have a parent node.
 
     def child_sequence(self, child):
         """Search for the sequence that contains this child.
@@ -566,19 +588,27 @@ class NodeNG:
 
         :returns: The node of the given types.
         """
-        if isinstance(self, klass):
-            yield self
-
-        if skip_klass is None:
-            for child_node in self.get_children():
-                yield from child_node.nodes_of_class(klass, skip_klass)
-
-            return
-
-        for child_node in self.get_children():
-            if isinstance(child_node, skip_klass):
+        # Walk the tree with an explicit stack instead of nesting one
+        # generator per level, children are pushed in reverse to keep
+        # the pre-order of the traversal.
+        stack: list[NodeNG] = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, klass):
+                yield node
+
+            if node._is_leaf:
                 continue
-            yield from child_node.nodes_of_class(klass, skip_klass)
+            if skip_klass is None:
+                children = list(node.get_children())
+            else:
+                children = [
+                    child_node
+                    for child_node in node.get_children()
+                    if not isinstance(child_node, skip_klass)
+                ]
+            children.reverse()
+            stack.extend(children)
 
     @cached_property
     def _assign_nodes_in_scope(self) -> list[nodes.Assign]:
@@ -650,7 +680,7 @@ class NodeNG:
 
     def as_string(self) -> str:
         """Get the source code that this node represents."""
-        return AsStringVisitor()(self)
+        return to_code(self)
 
     def repr_tree(
         self,
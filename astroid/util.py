@@ -43,13 +43,13 @@ class UninferableBase:
 
     __str__ = __repr__
 
-    def __getattribute__(self, name: str) -> Any:
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not defined on the class, so dunders
+        # and accept() are resolved by the regular, much faster, lookup.
         if name == "next":
             raise AttributeError("next method should not be called")
         if name.startswith("__") and name.endswith("__"):
-            return object.__getattribute__(self, name)
-        if name == "accept":
-            return object.__getattribute__(self, name)
+            raise AttributeError(name)
         return self
 
     def __call__(self, *args: Any, **kwargs: Any) -> UninferableBase:
@@ -508,6 +508,8 @@ class ImportNodeTest(resources.SysPathSetup, unittest.TestCase):
         imp_ = self.module2["YO"]
         self.assertEqual(imp_.real_name("YO"), "YO")
         self.assertRaises(AttributeInferenceError, imp_.real_name, "data")
+        imp_ = builder.extract_node("from os import *")
+        self.assertEqual(imp_.real_name("path"), "path")
 
     def test_as_string(self) -> None:
         ast = self.module["modutils"]
@@ -1716,6 +1718,34 @@ def test_is_generator_for_yield_in_aug_assign() -> None:
     assert bool(node.is_generator())
 
 
+def test_nodes_of_class_preorder() -> None:
+    code = """
+    def f(a):
+        return [a for b in range(a)]
+    x = f(1)
+    """
+    module = astroid.parse(code)
+    names = [n.name for n in module.nodes_of_class((nodes.Name, nodes.AssignName))]
+    assert names == ["a", "a", "b", "range", "a", "x", "f"]
+    skipped = module.nodes_of_class(nodes.Name, skip_klass=nodes.FunctionDef)
+    assert [n.name for n in skipped] == ["f"]
+
+
+def test_siblings_after_body_mutation() -> None:
+    module = astroid.parse("a = 1\nb = 2\nc = 3")
+    first, second, third = module.body
+    assert first.next_sibling() is second
+    assert third.previous_sibling() is second
+
+    module.body.remove(second)
+    assert first.next_sibling() is third
+    assert third.previous_sibling() is first
+
+    module.body = [third, first]
+    assert third.next_sibling() is first
+    assert first.next_sibling() is None
+
+
 @pytest.mark.skipif(not PY310_PLUS, reason="pattern matching was added in PY310")
 class TestPatternMatching:
     @staticmethod
@@ -186,3 +186,11 @@ class InferenceUtil(unittest.TestCase):
         inferred = next(node.infer())
         with self.assertRaises(InferenceError):
             list(nodes.unpack_infer(inferred))
+
+    def test_uninferable_attributes(self) -> None:
+        self.assertIs(Uninferable.some_attribute, Uninferable)
+        self.assertIs(Uninferable.some_method(), Uninferable)
+        self.assertFalse(hasattr(Uninferable, "next"))
+        self.assertFalse(hasattr(Uninferable, "__len__"))
+        self.assertEqual(repr(Uninferable), "Uninferable")
+        self.assertFalse(Uninferable)